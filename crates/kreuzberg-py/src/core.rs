@@ -6,7 +6,8 @@ use crate::config::ExtractionConfig;
 use crate::error::to_py_err;
 use crate::types::ExtractionResult;
 use pyo3::prelude::*;
-use pyo3::types::PyList;
+use pyo3::types::{PyBytes, PyList};
+use std::borrow::Cow;
 
 /// Extract a path string from Python input (str, pathlib.Path, or bytes).
 ///
@@ -39,6 +40,19 @@ fn extract_path_string(path: &Bound<'_, PyAny>) -> PyResult<String> {
     ))
 }
 
+/// Borrow the payload of extraction input data without copying where possible.
+///
+/// `bytes` objects are immutable, so their buffer is borrowed directly and stays
+/// valid while the GIL is released. Mutable inputs such as `bytearray` are copied
+/// so concurrent Python code cannot modify them mid-extraction.
+fn extract_data_bytes<'a>(data: &'a Bound<'_, PyAny>) -> PyResult<Cow<'a, [u8]>> {
+    if let Ok(bytes) = data.cast::<PyBytes>() {
+        return Ok(Cow::Borrowed(bytes.as_bytes()));
+    }
+
+    data.extract::<Vec<u8>>().map(Cow::Owned)
+}
+
 /// Extract content from a file (synchronous).
 ///
 /// Args:
@@ -105,10 +119,11 @@ pub fn extract_file_sync(
 #[pyo3(signature = (data, mime_type, config=ExtractionConfig::default()))]
 pub fn extract_bytes_sync(
     py: Python,
-    data: Vec<u8>,
+    data: &Bound<'_, PyAny>,
     mime_type: String,
     config: ExtractionConfig,
 ) -> PyResult<ExtractionResult> {
+    let data = extract_data_bytes(data)?;
     let rust_config = config.into();
 
     // Release GIL during sync extraction - OSError/RuntimeError must bubble up ~keep
@@ -190,7 +205,7 @@ pub fn batch_extract_files_sync(
 #[pyo3(signature = (data_list, mime_types, config=ExtractionConfig::default()))]
 pub fn batch_extract_bytes_sync(
     py: Python,
-    data_list: Vec<Vec<u8>>,
+    data_list: Vec<Bound<'_, PyAny>>,
     mime_types: Vec<String>,
     config: ExtractionConfig,
 ) -> PyResult<Py<PyList>> {
@@ -204,10 +219,14 @@ pub fn batch_extract_bytes_sync(
 
     let rust_config = config.into();
 
-    let contents: Vec<(&[u8], &str)> = data_list
+    let buffers = data_list
+        .iter()
+        .map(|data| extract_data_bytes(data))
+        .collect::<PyResult<Vec<_>>>()?;
+    let contents: Vec<(&[u8], &str)> = buffers
         .iter()
         .zip(mime_types.iter())
-        .map(|(data, mime)| (data.as_slice(), mime.as_str()))
+        .map(|(data, mime)| (data.as_ref(), mime.as_str()))
         .collect();
 
     // Release GIL during sync batch extraction - OSError/RuntimeError must bubble up ~keep
@@ -424,7 +443,7 @@ pub fn batch_extract_bytes<'py>(
 #[cfg(test)]
 mod tests {
     use super::*;
-    use pyo3::types::{PyBytes, PyString};
+    use pyo3::types::{PyByteArray, PyString};
     use std::sync::Once;
 
     fn prepare_python() {
@@ -487,20 +506,39 @@ mod tests {
     #[test]
     fn test_extract_bytes_sync_returns_content() {
         with_py(|py| {
-            let data = b"hello kreuzberg".to_vec();
-            let result = extract_bytes_sync(py, data, "text/plain".to_string(), ExtractionConfig::default())
+            let data = PyBytes::new(py, b"hello kreuzberg").into_any();
+            let result = extract_bytes_sync(py, &data, "text/plain".to_string(), ExtractionConfig::default())
                 .expect("text/plain extraction should succeed");
             assert_eq!(result.mime_type, "text/plain");
             assert!(result.content.contains("hello"));
         });
     }
 
+    #[test]
+    fn test_extract_data_bytes_borrows_bytes() {
+        with_py(|py| {
+            let data = PyBytes::new(py, b"borrowed").into_any();
+            let extracted = extract_data_bytes(&data).expect("bytes should extract");
+            assert!(matches!(extracted, Cow::Borrowed(b"borrowed")));
+        });
+    }
+
+    #[test]
+    fn test_extract_data_bytes_copies_bytearray() {
+        with_py(|py| {
+            let data = PyByteArray::new(py, b"copied").into_any();
+            let extracted = extract_data_bytes(&data).expect("bytearray should extract");
+            assert!(matches!(extracted, Cow::Owned(_)));
+            assert_eq!(extracted.as_ref(), b"copied");
+        });
+    }
+
     #[test]
     fn test_batch_extract_bytes_sync_length_mismatch() {
         with_py(|py| {
             let err = batch_extract_bytes_sync(
                 py,
-                vec![b"a".to_vec(), b"b".to_vec()],
+                vec![PyBytes::new(py, b"a").into_any(), PyBytes::new(py, b"b").into_any()],
                 vec!["text/plain".to_string()],
                 ExtractionConfig::default(),
             )
@@ -512,7 +550,10 @@ mod tests {
     #[test]
     fn test_batch_extract_bytes_sync_returns_list() {
         with_py(|py| {
-            let data = vec![b"first".to_vec(), b"second".to_vec()];
+            let data = vec![
+                PyBytes::new(py, b"first").into_any(),
+                PyBytes::new(py, b"second").into_any(),
+            ];
             let mimes = vec!["text/plain".to_string(), "text/plain".to_string()];
             let list = batch_extract_bytes_sync(py, data, mimes, ExtractionConfig::default())
                 .expect("batch extraction should succeed");
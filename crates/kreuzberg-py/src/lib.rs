@@ -265,8 +265,10 @@ fn detect_mime_type_from_bytes(data: &[u8]) -> PyResult<String> {
 ///     >>> mime_type = detect_mime_type_from_path("document.pdf")
 ///     >>> assert "pdf" in mime_type.lower()
 #[pyfunction]
-fn detect_mime_type_from_path(path: &str) -> PyResult<String> {
-    kreuzberg::detect_mime_type(path, true).map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
+fn detect_mime_type_from_path(py: Python<'_>, path: &str) -> PyResult<String> {
+    // Release GIL while the file is stat'ed and sniffed from disk ~keep
+    py.detach(|| kreuzberg::detect_mime_type(path, true))
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(e.to_string()))
 }
 
 /// Validate and normalize a MIME type.
@@ -201,10 +201,15 @@ impl SyncExtractor for HtmlExtractor {
             .map(|s| s.to_string())
             .unwrap_or_else(|_| String::from_utf8_lossy(content).to_string());
 
-        let tables = extract_html_tables(&html)?;
-
         let markdown = crate::extraction::html::convert_html_to_markdown(&html, config.html_options.clone())?;
 
+        // Tables come from the default conversion, so only re-convert when custom options were supplied ~keep
+        let tables = if config.html_options.is_none() {
+            parse_markdown_tables(&markdown)
+        } else {
+            extract_html_tables(&html)?
+        };
+
         let (html_metadata, content_without_frontmatter) = crate::extraction::html::parse_html_metadata(&markdown)?;
 
         Ok(ExtractionResult {
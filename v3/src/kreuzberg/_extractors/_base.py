@@ -40,7 +40,7 @@ logger = logging.getLogger(__name__)
 class Extractor(ABC):
     __slots__ = ("config", "mime_type")
 
-    SUPPORTED_MIME_TYPES: ClassVar[set[str]]
+    SUPPORTED_MIME_TYPES: ClassVar[set[str] | frozenset[str]]
 
     def __init__(self, mime_type: str, config: ExtractionConfig) -> None:
         self.mime_type = mime_type
@@ -26,13 +26,14 @@ try:
 except ImportError:  # pragma: no cover
     html2text = None
 
+_SCRIPT_STYLE_PATTERN = re.compile(r"<(script|style)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
 _HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
 _UNICODE_QUOTES_PATTERN = re.compile(r"[\u201c\u201d]")
 _UNICODE_SINGLE_QUOTES_PATTERN = re.compile(r"[\u2018\u2019]")
 
 
 class EmailExtractor(Extractor):
-    SUPPORTED_MIME_TYPES: ClassVar[set[str]] = {EML_MIME_TYPE}
+    SUPPORTED_MIME_TYPES: ClassVar[frozenset[str]] = frozenset({EML_MIME_TYPE})
 
     async def extract_bytes_async(self, content: bytes) -> ExtractionResult:
         return await run_sync(self.extract_bytes_sync, content)
@@ -116,18 +117,7 @@ class EmailExtractor(Extractor):
                 converted_text = h.handle(html_content)
                 text_parts.append(converted_text)
             else:
-                cleaned = re.sub(
-                    r"<script\b[^>]*>(?:(?!</script>).)*</script>",
-                    "",
-                    html_content,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
-                cleaned = re.sub(
-                    r"<style\b[^>]*>(?:(?!</style>).)*</style>",
-                    "",
-                    cleaned,
-                    flags=re.IGNORECASE | re.DOTALL,
-                )
+                cleaned = _SCRIPT_STYLE_PATTERN.sub("", html_content)
                 clean_html = _HTML_TAG_PATTERN.sub("", cleaned)
                 clean_html = unescape(clean_html)
                 clean_html = _UNICODE_QUOTES_PATTERN.sub('"', clean_html)
@@ -181,11 +171,9 @@ class EmailExtractor(Extractor):
             if raw is None:
                 continue
 
-            fmt = mime.split("/", 1)[1].lower()
-            if name and "." in name:
-                ext = name.rsplit(".", 1)[-1].lower()
-                if ext:
-                    fmt = ext
+            fmt = name.rpartition(".")[2].lower() if name and "." in name else ""
+            if not fmt:
+                fmt = mime.partition("/")[2].lower()
 
             filename = name or f"attachment_image_{idx}.{fmt}"
             images.append(
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from anyio import Path as AsyncPath
@@ -22,8 +25,65 @@ from kreuzberg._utils._sync import run_maybe_async, run_sync
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from html_to_markdown._html_to_markdown import ConversionOptions
+
 logger = logging.getLogger(__name__)
 
+MARKDOWN_CACHE_MAX_SIZE = 64 * 1024 * 1024
+
+_markdown_cache: OrderedDict[tuple[bytes, HTMLToMarkdownConfig], tuple[str, int]] = OrderedDict()
+_markdown_cache_size = 0
+_markdown_cache_lock = threading.Lock()
+
+
+def _get_cached_markdown(key: tuple[bytes, HTMLToMarkdownConfig]) -> str | None:
+    with _markdown_cache_lock:
+        entry = _markdown_cache.get(key)
+        if entry is None:
+            return None
+        _markdown_cache.move_to_end(key)
+        return entry[0]
+
+
+def _set_cached_markdown(key: tuple[bytes, HTMLToMarkdownConfig], markdown: str) -> None:
+    global _markdown_cache_size
+
+    size = len(markdown.encode())
+    if size > MARKDOWN_CACHE_MAX_SIZE:
+        return
+
+    with _markdown_cache_lock:
+        if (previous := _markdown_cache.pop(key, None)) is not None:
+            _markdown_cache_size -= previous[1]
+        _markdown_cache[key] = (markdown, size)
+        _markdown_cache_size += size
+        while _markdown_cache_size > MARKDOWN_CACHE_MAX_SIZE:
+            _, (_, evicted_size) = _markdown_cache.popitem(last=False)
+            _markdown_cache_size -= evicted_size
+
+
+def _convert_with_cache(
+    content: bytes,
+    html_content: str,
+    html_config: HTMLToMarkdownConfig,
+    conversion_options: ConversionOptions,
+) -> str:
+    cache_key = (hashlib.blake2b(content, digest_size=16).digest(), html_config)
+    if (cached_markdown := _get_cached_markdown(cache_key)) is not None:
+        return cached_markdown
+
+    markdown: str = rust_convert(html_content, conversion_options)
+    _set_cached_markdown(cache_key, markdown)
+    return markdown
+
+
+def clear_markdown_cache() -> None:
+    global _markdown_cache_size
+
+    with _markdown_cache_lock:
+        _markdown_cache.clear()
+        _markdown_cache_size = 0
+
 
 class HTMLExtractor(Extractor):
     SUPPORTED_MIME_TYPES: ClassVar[set[str]] = {HTML_MIME_TYPE}
@@ -71,10 +131,13 @@ class HTMLExtractor(Extractor):
                     image_config=inline_image_config,
                 )
             else:
-                markdown = rust_convert(
-                    html_content,
-                    conversion_options,
-                )
+                if extraction_config and extraction_config.use_cache and extraction_config.enable_content_cache:
+                    markdown = _convert_with_cache(content, html_content, html_config, conversion_options)
+                else:
+                    markdown = rust_convert(
+                        html_content,
+                        conversion_options,
+                    )
                 images_payload = []
                 warnings = []
         except (HtmlToMarkdownError, ValueError) as exc:
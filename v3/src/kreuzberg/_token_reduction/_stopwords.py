@@ -96,13 +96,7 @@ class StopwordsManager:
 
     def add_custom_stopwords(self, language: str, words: list[str] | set[str]) -> None:
         """Add custom stopwords for a language."""
-        if language not in self._custom_stopwords:
-            self._custom_stopwords[language] = set()
-
-        if isinstance(words, list):
-            words = set(words)
-
-        self._custom_stopwords[language].update(words)
+        self._custom_stopwords.setdefault(language, set()).update(words)
 
 
 def _create_default_manager() -> StopwordsManager:
@@ -1074,6 +1074,8 @@ class ExtractionConfig(ConfigDict):
     """Configuration for enhanced JSON extraction features. If None, uses standard JSON processing."""
     use_cache: bool = True
     """Whether to use caching for extraction results. Set to False to disable all caching."""
+    enable_content_cache: bool = False
+    """Whether to memoize HTML to Markdown conversions in memory, keyed by a hash of the input content."""
     target_dpi: int = 150
     """Target DPI for OCR processing. Images and PDF pages will be scaled to this DPI for optimal OCR results."""
     max_image_dimension: int = 25000
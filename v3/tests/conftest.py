@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 test_documents_folder = Path(__file__).parent.parent.parent / "test_documents"
 
 
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
 @pytest.fixture(scope="session")
 def searchable_pdf() -> Path:
     return test_documents_folder / "pdfs" / "searchable.pdf"
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
@@ -491,11 +490,9 @@ def test_find_config_file_parent_directory(tmp_path: Path) -> None:
     assert result == config_file
 
 
-def test_find_config_file_not_found() -> None:
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        result = find_config_file(tmp_path)
-        assert result is None
+def test_find_config_file_not_found(tmp_path: Path) -> None:
+    result = find_config_file(tmp_path)
+    assert result is None
 
 
 def test_load_default_config(tmp_path: Path) -> None:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
 import pytest
@@ -16,6 +15,9 @@ from kreuzberg._mime_types import (
 )
 from kreuzberg.exceptions import ValidationError
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
 def test_validate_mime_type_with_explicit_mime_type() -> None:
     result = validate_mime_type(mime_type="application/pdf")
@@ -222,16 +224,12 @@ def test_detect_mime_type_uncached_unsupported_mime() -> None:
             _detect_mime_type_uncached("file.xyz", check_file_exists=True)
 
 
-def test_real_file_mime_detection() -> None:
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
-        tmp.write(b"Hello World")
-        tmp_path = tmp.name
+def test_real_file_mime_detection(tmp_path: Path) -> None:
+    text_file = tmp_path / "real.txt"
+    text_file.write_bytes(b"Hello World")
 
-    try:
-        result = validate_mime_type(file_path=tmp_path)
-        assert result == "text/plain"
-    finally:
-        Path(tmp_path).unlink()
+    result = validate_mime_type(file_path=str(text_file))
+    assert result == "text/plain"
 
 
 def test_mime_type_constants() -> None:
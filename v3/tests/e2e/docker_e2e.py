@@ -146,8 +146,8 @@ def test_api_health(image_name: str) -> bool:
             return False
 
     try:
-        deadline = time.time() + 30
-        while time.time() < deadline:
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
             if _is_healthy():
                 return True
             time.sleep(1)
@@ -267,7 +267,7 @@ def test_api_extraction(image_name: str) -> bool:
             temp_file = f.name
 
         try:
-            deadline = time.time() + 30
+            deadline = time.monotonic() + 30
             last_stderr = ""
 
             def _try_extract() -> bool:
@@ -298,7 +298,7 @@ def test_api_extraction(image_name: str) -> bool:
                 content = response[0].get("content", "")
                 return test_content in content
 
-            while time.time() < deadline:
+            while time.monotonic() < deadline:
                 if _try_extract():
                     return True
                 time.sleep(1)
@@ -944,3 +944,18 @@ def test_email_integration_comprehensive_html_with_complex_entities_without_html
             assert "Title & Subtitle" in result.content
             assert "Price: €100 <discount>" in result.content
             assert 'Quote: "Hello"' in result.content
+
+
+def test_email_html_script_and_style_bodies_removed_without_html2text(email_extractor: EmailExtractor) -> None:
+    with patch("mailparse.EmailDecode.load") as mock_load:
+        mock_load.return_value = {
+            "html": "<p>Visible</p><SCRIPT type='text/javascript'>\nalert('hidden');\n</script >"
+            "<style>\nbody { color: red; }\n</STYLE>",
+        }
+
+        with patch("kreuzberg._extractors._email.html2text", None):
+            result = email_extractor.extract_bytes_sync(b"html email")
+
+            assert "Visible" in result.content
+            assert "alert" not in result.content
+            assert "color: red" not in result.content
@@ -3,18 +3,30 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pytest
-from kreuzberg._extractors._html import HTMLExtractor
+from kreuzberg._extractors import _html as html_module
+from kreuzberg._extractors._html import HTMLExtractor, clear_markdown_cache
+from kreuzberg._types import ExtractionConfig, HTMLToMarkdownConfig
 from kreuzberg.extraction import DEFAULT_CONFIG
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
+    from pytest_mock import MockerFixture
+
 
 @pytest.fixture(scope="session")
 def extractor() -> HTMLExtractor:
     return HTMLExtractor(mime_type="text/html", config=DEFAULT_CONFIG)
 
 
+@pytest.fixture
+def empty_markdown_cache() -> Generator[None, None, None]:
+    clear_markdown_cache()
+    yield
+    clear_markdown_cache()
+
+
 @pytest.mark.anyio
 async def test_extract_html_string(html_document: Path, extractor: HTMLExtractor) -> None:
     result = await extractor.extract_path_async(html_document)
@@ -49,3 +61,88 @@ def test_extract_html_bytes_sync(extractor: HTMLExtractor) -> None:
     assert result.mime_type == "text/markdown"
     assert "Sync Test" in result.content
     assert "Testing sync extraction." in result.content
+
+
+@pytest.mark.usefixtures("empty_markdown_cache")
+def test_extract_html_bytes_sync_content_cache(mocker: MockerFixture) -> None:
+    extractor = HTMLExtractor(mime_type="text/html", config=ExtractionConfig(enable_content_cache=True))
+    convert_spy = mocker.spy(html_module, "rust_convert")
+    html_content = b"<html><body><h1>Cached</h1><p>Converted once.</p></body></html>"
+
+    first = extractor.extract_bytes_sync(html_content)
+    second = extractor.extract_bytes_sync(html_content)
+
+    assert first.content == second.content
+    assert "Cached" in second.content
+    assert convert_spy.call_count == 1
+
+
+@pytest.mark.usefixtures("empty_markdown_cache")
+def test_extract_html_bytes_sync_content_cache_skipped_with_inline_images(mocker: MockerFixture) -> None:
+    extractor = HTMLExtractor(
+        mime_type="text/html", config=ExtractionConfig(enable_content_cache=True, extract_images=True)
+    )
+    convert_spy = mocker.spy(html_module, "convert_with_inline_images")
+    html_content = b"<html><body><h1>Not cached</h1><p>Converted twice.</p></body></html>"
+
+    first = extractor.extract_bytes_sync(html_content)
+    second = extractor.extract_bytes_sync(html_content)
+
+    assert first.content == second.content
+    assert convert_spy.call_count == 2
+    assert not html_module._markdown_cache
+
+
+@pytest.mark.usefixtures("empty_markdown_cache")
+def test_extract_html_bytes_sync_content_cache_disabled_by_use_cache(mocker: MockerFixture) -> None:
+    extractor = HTMLExtractor(
+        mime_type="text/html", config=ExtractionConfig(use_cache=False, enable_content_cache=True)
+    )
+    convert_spy = mocker.spy(html_module, "rust_convert")
+    html_content = b"<html><body><h1>Uncached</h1><p>Caching is off.</p></body></html>"
+
+    extractor.extract_bytes_sync(html_content)
+    extractor.extract_bytes_sync(html_content)
+
+    assert convert_spy.call_count == 2
+    assert not html_module._markdown_cache
+
+
+@pytest.mark.usefixtures("empty_markdown_cache")
+def test_extract_html_bytes_sync_content_cache_keyed_by_config(mocker: MockerFixture) -> None:
+    convert_spy = mocker.spy(html_module, "rust_convert")
+    html_content = b"<html><body><h1>Heading</h1><p>Same bytes.</p></body></html>"
+
+    atx = HTMLExtractor(
+        mime_type="text/html",
+        config=ExtractionConfig(enable_content_cache=True, html_to_markdown_config=HTMLToMarkdownConfig()),
+    )
+    underlined = HTMLExtractor(
+        mime_type="text/html",
+        config=ExtractionConfig(
+            enable_content_cache=True, html_to_markdown_config=HTMLToMarkdownConfig(heading_style="underlined")
+        ),
+    )
+
+    atx_result = atx.extract_bytes_sync(html_content)
+    underlined_result = underlined.extract_bytes_sync(html_content)
+
+    assert convert_spy.call_count == 2
+    assert atx_result.content != underlined_result.content
+
+
+@pytest.mark.usefixtures("empty_markdown_cache")
+def test_markdown_cache_evicts_oldest_entry_over_size_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(html_module, "MARKDOWN_CACHE_MAX_SIZE", 10)
+    config = HTMLToMarkdownConfig()
+    oldest, middle, newest = (b"oldest", config), (b"middle", config), (b"newest", config)
+
+    html_module._set_cached_markdown(oldest, "aaaa")
+    html_module._set_cached_markdown(middle, "\u00e9\u00e9")
+    html_module._set_cached_markdown(newest, "cccc")
+
+    assert html_module._get_cached_markdown(oldest) is None
+    assert html_module._get_cached_markdown(middle) == "\u00e9\u00e9"
+    assert html_module._get_cached_markdown(newest) == "cccc"
+    assert html_module._markdown_cache_size == 8
+    assert html_module._markdown_cache_size <= html_module.MARKDOWN_CACHE_MAX_SIZE
@@ -4,8 +4,15 @@ import pytest
 from kreuzberg import ExtractionConfig, JSONExtractionConfig
 from kreuzberg._extractors._structured import StructuredDataExtractor
 from kreuzberg._mime_types import JSON_MIME_TYPE
+from kreuzberg.extraction import DEFAULT_CONFIG
 
 REAL_WORLD_JSON_DIR = Path(__file__).parent.parent / "test_source_files" / "json" / "real_world"
+LARGE_ARRAY_JSON = b'{"data": [' + b",".join(f'{{"id": {i}, "value": "item_{i}"}}'.encode() for i in range(100)) + b"]}"
+
+
+@pytest.fixture(scope="session")
+def real_world_json_files() -> frozenset[str]:
+    return frozenset(path.name for path in REAL_WORLD_JSON_DIR.glob("*.json"))
 
 
 def test_json_config_default_values() -> None:
@@ -55,8 +62,7 @@ def test_structured_extractor_json_config_property() -> None:
 
 
 def test_structured_extractor_no_json_config() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     assert extractor._json_config is None
 
@@ -226,8 +232,7 @@ def test_combined_features() -> None:
 
 
 def test_default_text_field_patterns() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     json_content = b'{"title": "Test Title", "content": "Test Content", "body": "Test Body"}'
     result = extractor.extract_bytes_sync(json_content)
@@ -237,30 +242,13 @@ def test_default_text_field_patterns() -> None:
     assert result.metadata.get("body") == "Test Body"
 
 
-def test_iss_location_json() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
-
-    test_file = REAL_WORLD_JSON_DIR / "iss_location.json"
-    if not test_file.exists():
-        pytest.skip(f"Test file {test_file} not found")
-
-    result = extractor.extract_path_sync(test_file)
-
-    assert result.content
-    assert "iss_position" in result.content
-    assert "longitude" in result.content
-    assert "latitude" in result.content
-    assert result.metadata.get("message") == "success"
-
-
-def test_github_emojis_json() -> None:
+def test_github_emojis_json(real_world_json_files: frozenset[str]) -> None:
     json_config = JSONExtractionConfig(extract_schema=True, max_depth=2)
     config = ExtractionConfig(json_config=json_config)
     extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
 
     test_file = REAL_WORLD_JSON_DIR / "github_emojis.json"
-    if not test_file.exists():
+    if "github_emojis.json" not in real_world_json_files:
         pytest.skip(f"Test file {test_file} not found")
 
     result = extractor.extract_path_sync(test_file)
@@ -274,7 +262,7 @@ def test_github_emojis_json() -> None:
         assert "https://github.githubassets.com" in result.content
 
 
-def test_package_json() -> None:
+def test_package_json(real_world_json_files: frozenset[str]) -> None:
     json_config = JSONExtractionConfig(
         extract_schema=True,
         flatten_nested_objects=False,
@@ -283,7 +271,7 @@ def test_package_json() -> None:
     extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
 
     test_file = REAL_WORLD_JSON_DIR / "package.json"
-    if not test_file.exists():
+    if "package.json" not in real_world_json_files:
         pytest.skip(f"Test file {test_file} not found")
 
     result = extractor.extract_path_sync(test_file)
@@ -295,7 +283,7 @@ def test_package_json() -> None:
     assert "[nested object" in result.content
 
 
-def test_openapi_spec_json() -> None:
+def test_openapi_spec_json(real_world_json_files: frozenset[str]) -> None:
     json_config = JSONExtractionConfig(
         extract_schema=True, max_depth=3, custom_text_field_patterns=frozenset({"summary", "operationId"})
     )
@@ -303,7 +291,7 @@ def test_openapi_spec_json() -> None:
     extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
 
     test_file = REAL_WORLD_JSON_DIR / "openapi_spec.json"
-    if not test_file.exists():
+    if "openapi_spec.json" not in real_world_json_files:
         pytest.skip(f"Test file {test_file} not found")
 
     result = extractor.extract_path_sync(test_file)
@@ -333,11 +321,7 @@ def test_large_json_array_handling() -> None:
     config = ExtractionConfig(json_config=json_config)
     extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
 
-    large_array_json = (
-        b'{"data": [' + b",".join(f'{{"id": {i}, "value": "item_{i}"}}'.encode() for i in range(100)) + b"]}"
-    )
-
-    result = extractor.extract_bytes_sync(large_array_json)
+    result = extractor.extract_bytes_sync(LARGE_ARRAY_JSON)
 
     assert result.content
     if "json_schema" in result.metadata:
@@ -406,21 +390,30 @@ def test_mixed_type_json() -> None:
 
 
 @pytest.mark.parametrize(
-    "filename,expected_content",
+    "filename,expected_content,expected_metadata",
     [
-        ("iss_location.json", "iss_position"),
-        ("package.json", "dependencies"),
-        ("aws_policy.json", "Statement"),
-        ("openapi_spec.json", "openapi"),
+        ("iss_location.json", ("iss_position", "longitude", "latitude"), {"message": "success"}),
+        ("package.json", ("dependencies",), {}),
+        ("aws_policy.json", ("Statement",), {}),
+        ("openapi_spec.json", ("openapi",), {}),
     ],
 )
-def test_real_world_files_exist_and_parse(filename: str, expected_content: str) -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+def test_real_world_files_exist_and_parse(
+    filename: str,
+    expected_content: tuple[str, ...],
+    expected_metadata: dict[str, str],
+    real_world_json_files: frozenset[str],
+) -> None:
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     test_file = REAL_WORLD_JSON_DIR / filename
-    if test_file.exists():
-        result = extractor.extract_path_sync(test_file)
-        assert result.content
-        assert expected_content in result.content
-        assert "parse_error" not in result.metadata
+    if filename not in real_world_json_files:
+        pytest.skip(f"Test file {test_file} not found")
+
+    result = extractor.extract_path_sync(test_file)
+    assert result.content
+    for expected in expected_content:
+        assert expected in result.content
+    for key, value in expected_metadata.items():
+        assert result.metadata.get(key) == value
+    assert "parse_error" not in result.metadata
@@ -24,13 +24,19 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 IS_CI = os.environ.get("CI", "false").lower() == "true"
+LONG_VALID_TEXT = "A" * 1000
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extractor() -> PDFExtractor:
     return PDFExtractor(mime_type="application/pdf", config=DEFAULT_CONFIG)
 
 
+@pytest.fixture(scope="session")
+def test_article_bytes(test_article: Path) -> bytes:
+    return test_article.read_bytes()
+
+
 @pytest.mark.anyio
 async def test_extract_pdf_searchable_text(extractor: PDFExtractor, searchable_pdf: Path) -> None:
     result = await extractor._extract_pdf_searchable_text(searchable_pdf)
@@ -110,51 +116,49 @@ async def test_extract_pdf_searchable_text_raises_parsing_error(extractor: PDFEx
     assert str(pdf_path) in str(exc_info.value.context["file"]["path"])
 
 
-def test_validate_empty_text(extractor: PDFExtractor) -> None:
-    assert not extractor._validate_extracted_text("")
-    assert not extractor._validate_extracted_text("   ")
-    assert not extractor._validate_extracted_text("\n\n")
-
-
-def test_validate_normal_text(extractor: PDFExtractor) -> None:
-    assert extractor._validate_extracted_text("Hello World!")
-    assert extractor._validate_extracted_text("Line 1\nLine 2")
-    assert extractor._validate_extracted_text(" 2024 Company")
-    assert extractor._validate_extracted_text("Special chars: !@#$%^&*()")
-    assert extractor._validate_extracted_text("""
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("", False),
+        ("   ", False),
+        ("\n\n", False),
+        ("Hello World!", True),
+        ("Line 1\nLine 2", True),
+        (" 2024 Company", True),
+        ("Special chars: !@#$%^&*()", True),
+        (
+            """
         This is a normal paragraph of text that should pass validation.
         It contains normal punctuation, numbers (123), and symbols (!@#$%).
         Even with multiple paragraphs and line breaks, it should be fine.
-    """)
-
-
-def test_validate_short_corrupted_text(extractor: PDFExtractor) -> None:
-    assert not extractor._validate_extracted_text("\x00\x00\x00")
-    assert extractor._validate_extracted_text("Hi\x00\x00")
-    assert extractor._validate_extracted_text("Hi\x00")
-    assert extractor._validate_extracted_text("Short \ufffd")
-
-
-def test_validate_long_corrupted_text(extractor: PDFExtractor) -> None:
-    base_text = "A" * 1000
-
-    text_low_corruption = base_text + ("\x00" * 40)
-    assert extractor._validate_extracted_text(text_low_corruption)
-
-    text_high_corruption = base_text + ("\x00" * 60)
-    assert not extractor._validate_extracted_text(text_high_corruption)
-
-
-def test_validate_custom_corruption_threshold(extractor: PDFExtractor) -> None:
-    base_text = "A" * 1000
-    corrupted_chars = "\x00" * 100
-    text = base_text + corrupted_chars
-
-    assert not extractor._validate_extracted_text(text)
-
-    assert extractor._validate_extracted_text(text, corruption_threshold=0.15)
-
-    assert not extractor._validate_extracted_text(text, corruption_threshold=0.03)
+    """,
+            True,
+        ),
+        ("\x00\x00\x00", False),
+        ("Hi\x00\x00", True),
+        ("Hi\x00", True),
+        ("Short \ufffd", True),
+    ],
+)
+def test_validate_extracted_text(extractor: PDFExtractor, text: str, expected: bool) -> None:
+    assert extractor._validate_extracted_text(text) is expected
+
+
+@pytest.mark.parametrize(
+    "corrupted_count,corruption_threshold,expected",
+    [
+        (40, 0.05, True),
+        (60, 0.05, False),
+        (100, 0.05, False),
+        (100, 0.15, True),
+        (100, 0.03, False),
+    ],
+)
+def test_validate_long_corrupted_text(
+    extractor: PDFExtractor, corrupted_count: int, corruption_threshold: float, expected: bool
+) -> None:
+    text = LONG_VALID_TEXT + ("\x00" * corrupted_count)
+    assert extractor._validate_extracted_text(text, corruption_threshold=corruption_threshold) is expected
 
 
 @pytest.mark.anyio
@@ -184,10 +188,8 @@ async def test_extract_pdf_with_rich_metadata(extractor: PDFExtractor, test_arti
 
 
 @pytest.mark.anyio
-async def test_extract_pdf_bytes_with_metadata(extractor: PDFExtractor, test_article: Path) -> None:
-    pdf_bytes = test_article.read_bytes()
-
-    result = await extractor.extract_bytes_async(pdf_bytes)
+async def test_extract_pdf_bytes_with_metadata(extractor: PDFExtractor, test_article_bytes: bytes) -> None:
+    result = await extractor.extract_bytes_async(test_article_bytes)
 
     assert result.content.strip()
 
@@ -222,10 +224,8 @@ async def test_extract_tables_from_pdf(pdf_with_table: Path) -> None:
         assert isinstance(table["cropped_image"], (Image, type(None)))
 
 
-def test_extract_pdf_bytes_sync(extractor: PDFExtractor, test_article: Path) -> None:
-    pdf_bytes = test_article.read_bytes()
-
-    result = extractor.extract_bytes_sync(pdf_bytes)
+def test_extract_pdf_bytes_sync(extractor: PDFExtractor, test_article_bytes: bytes) -> None:
+    result = extractor.extract_bytes_sync(test_article_bytes)
 
     assert isinstance(result, ExtractionResult)
     assert result.content.strip()
@@ -405,12 +405,11 @@ def test_pdf_password_configuration() -> None:
     assert passwords == [""]
 
 
-def test_pdf_password_attempts_with_parse_with_password_attempts(test_article: Path) -> None:
+def test_pdf_password_attempts_with_parse_with_password_attempts(test_article_bytes: bytes) -> None:
     config = ExtractionConfig(pdf_password="")
     extractor = PDFExtractor(mime_type="application/pdf", config=config)
 
-    content = test_article.read_bytes()
-    document = extractor._parse_with_password_attempts(content)
+    document = extractor._parse_with_password_attempts(test_article_bytes)
 
     assert document is not None
     assert len(document.pages) > 0
@@ -418,7 +417,7 @@ def test_pdf_password_attempts_with_parse_with_password_attempts(test_article: P
     config = ExtractionConfig(pdf_password="wrongpassword")
     extractor = PDFExtractor(mime_type="application/pdf", config=config)
 
-    document = extractor._parse_with_password_attempts(content)
+    document = extractor._parse_with_password_attempts(test_article_bytes)
     assert document is not None
     assert len(document.pages) > 0
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path as SyncPath
 from typing import TYPE_CHECKING, Any
@@ -23,19 +24,32 @@ if TYPE_CHECKING:
     from pytest_mock import MockerFixture
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def extractor() -> SpreadSheetExtractor:
     return SpreadSheetExtractor(
         mime_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", config=DEFAULT_CONFIG
     )
 
 
+@pytest.fixture(scope="session")
+def excel_bytes(excel_document: Path) -> bytes:
+    return SyncPath(excel_document).read_bytes()
+
+
+@pytest.fixture(scope="session")
+def excel_sync_result(excel_document: Path, extractor: SpreadSheetExtractor) -> ExtractionResult:
+    return extractor.extract_path_sync(excel_document)
+
+
 @pytest.mark.anyio
-async def test_extract_xlsx_file(excel_document: Path, extractor: SpreadSheetExtractor) -> None:
+async def test_extract_xlsx_file(
+    excel_document: Path, extractor: SpreadSheetExtractor, excel_sync_result: ExtractionResult
+) -> None:
     result = await extractor.extract_path_async(excel_document)
     assert isinstance(result.content, str)
     assert result.content.strip()
     assert result.mime_type == "text/markdown"
+    assert result.content == excel_sync_result.content
 
 
 @pytest.mark.anyio
@@ -113,21 +127,21 @@ async def test_extract_xlsx_file_parsing_error_passthrough(
     assert exc_info.value is original_error
 
 
-def test_extract_bytes_sync(excel_document: Path, extractor: SpreadSheetExtractor) -> None:
-    content = SyncPath(excel_document).read_bytes()
-    result = extractor.extract_bytes_sync(content)
+def test_extract_bytes_sync(
+    excel_bytes: bytes, extractor: SpreadSheetExtractor, excel_sync_result: ExtractionResult
+) -> None:
+    result = extractor.extract_bytes_sync(excel_bytes)
 
     assert isinstance(result, ExtractionResult)
     assert result.mime_type == MARKDOWN_MIME_TYPE
     assert result.content
+    assert result.content == excel_sync_result.content
 
 
-def test_extract_path_sync(excel_document: Path, extractor: SpreadSheetExtractor) -> None:
-    result = extractor.extract_path_sync(excel_document)
-
-    assert isinstance(result, ExtractionResult)
-    assert result.mime_type == MARKDOWN_MIME_TYPE
-    assert result.content
+def test_extract_path_sync(excel_sync_result: ExtractionResult) -> None:
+    assert isinstance(excel_sync_result, ExtractionResult)
+    assert excel_sync_result.mime_type == MARKDOWN_MIME_TYPE
+    assert excel_sync_result.content
 
 
 @pytest.mark.parametrize(
@@ -149,6 +163,24 @@ def test_convert_cell_to_str(extractor: SpreadSheetExtractor, value: Any, expect
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "mime_type,expected_ext",
+    [
+        ("application/vnd.ms-excel", ".xls"),
+        ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", ".xlsx"),
+        ("application/vnd.ms-excel.sheet.macroEnabled.12", ".xlsm"),
+        ("application/vnd.ms-excel.sheet.binary.macroEnabled.12", ".xlsb"),
+        ("application/vnd.ms-excel.addin.macroEnabled.12", ".xlam"),
+        ("application/vnd.ms-excel.template.macroEnabled.12", ".xltm"),
+        ("application/vnd.oasis.opendocument.spreadsheet", ".ods"),
+        ("application/unknown", ".xlsx"),
+    ],
+)
+def test_get_file_extension_mapping(mime_type: str, expected_ext: str) -> None:
+    extractor = SpreadSheetExtractor(mime_type=mime_type, config=DEFAULT_CONFIG)
+    assert extractor._get_file_extension() == expected_ext
+
+
 @pytest.mark.anyio
 async def test_convert_sheet_to_text_with_missing_cells(mocker: MockerFixture, extractor: SpreadSheetExtractor) -> None:
     mock_workbook = mocker.Mock(spec=CalamineWorkbook)
@@ -265,11 +297,17 @@ def test_extract_path_sync_parsing_error_wrapping(
     assert "Original sync parsing error" in str(exc_info.value.context["error"])
 
 
+def test_extract_path_sync_missing_file(extractor: SpreadSheetExtractor, tmp_path: Path) -> None:
+    missing_path = tmp_path / "does_not_exist.xlsx"
+
+    with pytest.raises(ParsingError) as exc_info:
+        extractor.extract_path_sync(missing_path)
+
+    assert str(missing_path) in exc_info.value.context["file"]
+
+
 @pytest.mark.anyio
 async def test_extract_bytes_async_exception_cleanup(extractor: SpreadSheetExtractor, mocker: MockerFixture) -> None:
-    from contextlib import asynccontextmanager
-    from pathlib import Path
-
     cleanup_called = False
 
     async def mock_cleanup() -> None:
@@ -277,9 +315,9 @@ async def test_extract_bytes_async_exception_cleanup(extractor: SpreadSheetExtra
         cleanup_called = True
 
     @asynccontextmanager
-    async def mock_temp_file(extension: str, content: bytes | None = None) -> AsyncGenerator[Path, None]:
+    async def mock_temp_file(extension: str, content: bytes | None = None) -> AsyncGenerator[SyncPath, None]:
         try:
-            yield Path("/tmp/test_excel.xlsx")
+            yield SyncPath("/tmp/test_excel.xlsx")
         finally:
             await mock_cleanup()
 
@@ -342,8 +380,6 @@ def test_extract_spreadsheet_metadata_comprehensive(extractor: SpreadSheetExtrac
     mock_metadata.company = "Test Company"
     mock_metadata.manager = "Test Manager"
 
-    from datetime import datetime, timezone
-
     mock_metadata.created = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
     mock_metadata.modified = datetime(2023, 2, 1, 14, 30, 0, tzinfo=timezone.utc)
 
@@ -664,8 +700,6 @@ def test_spread_sheet_extractor_comprehensive_cell_conversion_convert_cell_to_st
 def test_spread_sheet_extractor_comprehensive_cell_conversion_convert_cell_to_str_datetime_variants(
     extractor: SpreadSheetExtractor,
 ) -> None:
-    from datetime import datetime, time, timedelta, timezone
-
     dt_with_microseconds = datetime(2023, 1, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
     result = extractor._convert_cell_to_str(dt_with_microseconds)
     assert result == "2023-01-01T12:30:45.123456+00:00"
@@ -1,27 +1,35 @@
+from pathlib import Path
+
 import pytest
-from kreuzberg import ExtractionConfig
 from kreuzberg._extractors._structured import StructuredDataExtractor
 from kreuzberg._mime_types import JSON_MIME_TYPE, TOML_MIME_TYPE, YAML_MIME_TYPE
+from kreuzberg.extraction import DEFAULT_CONFIG
 
 
-def test_structured_supports_json_mime_type() -> None:
-    assert StructuredDataExtractor.supports_mimetype(JSON_MIME_TYPE)
-    assert StructuredDataExtractor.supports_mimetype("text/json")
+@pytest.fixture(scope="session")
+def json_document_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("structured") / "document.json"
+    path.write_text('{"title": "Path Test", "description": "Path content"}')
+    return path
 
 
-def test_structured_supports_yaml_mime_type() -> None:
-    assert StructuredDataExtractor.supports_mimetype(YAML_MIME_TYPE)
-    assert StructuredDataExtractor.supports_mimetype("text/yaml")
+@pytest.fixture(scope="session")
+def yaml_document_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("structured") / "document.yaml"
+    path.write_text("title: Sync Path Test\ndescription: Sync path content")
+    return path
 
 
-def test_structured_supports_toml_mime_type() -> None:
-    assert StructuredDataExtractor.supports_mimetype(TOML_MIME_TYPE)
-    assert StructuredDataExtractor.supports_mimetype("text/toml")
+@pytest.mark.parametrize(
+    "mime_type",
+    [JSON_MIME_TYPE, "text/json", YAML_MIME_TYPE, "text/yaml", TOML_MIME_TYPE, "text/toml"],
+)
+def test_structured_supports_mime_type(mime_type: str) -> None:
+    assert StructuredDataExtractor.supports_mimetype(mime_type)
 
 
 def test_structured_extract_json_content() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     json_content = b'{"title": "Test Document", "content": "This is test content", "count": 42}'
 
@@ -36,8 +44,7 @@ def test_structured_extract_json_content() -> None:
 
 
 def test_structured_extract_yaml_content() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(YAML_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(YAML_MIME_TYPE, DEFAULT_CONFIG)
 
     yaml_content = b"""title: Test Config
 description: This is a test configuration
@@ -57,8 +64,7 @@ items:
 
 
 def test_structured_extract_toml_content() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(TOML_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(TOML_MIME_TYPE, DEFAULT_CONFIG)
 
     toml_content = b"""title = "Test Project"
 description = "This is a test TOML configuration"
@@ -84,8 +90,7 @@ enabled = true
 
 
 def test_structured_extract_invalid_json_fallback() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     invalid_json = b'{"invalid": json content'
 
@@ -98,8 +103,7 @@ def test_structured_extract_invalid_json_fallback() -> None:
 
 @pytest.mark.anyio
 async def test_structured_extract_bytes_async() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     json_content = b'{"title": "Async Test", "content": "Async content"}'
     result = await extractor.extract_bytes_async(json_content)
@@ -110,50 +114,27 @@ async def test_structured_extract_bytes_async() -> None:
 
 
 @pytest.mark.anyio
-async def test_structured_extract_path_async() -> None:
-    import tempfile
-    from pathlib import Path
-
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
-
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write('{"title": "Path Test", "description": "Path content"}')
-        temp_path = Path(f.name)
-
-    try:
-        result = await extractor.extract_path_async(temp_path)
-        assert "Path Test" in result.content
-        assert result.metadata["title"] == "Path Test"
-    finally:
-        temp_path.unlink()
-
+async def test_structured_extract_path_async(json_document_path: Path) -> None:
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
-def test_structured_extract_path_sync() -> None:
-    import tempfile
-    from pathlib import Path
+    result = await extractor.extract_path_async(json_document_path)
+    assert "Path Test" in result.content
+    assert result.metadata["title"] == "Path Test"
 
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(YAML_MIME_TYPE, config)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("title: Sync Path Test\ndescription: Sync path content")
-        temp_path = Path(f.name)
+def test_structured_extract_path_sync(yaml_document_path: Path) -> None:
+    extractor = StructuredDataExtractor(YAML_MIME_TYPE, DEFAULT_CONFIG)
 
-    try:
-        result = extractor.extract_path_sync(temp_path)
-        assert "Sync Path Test" in result.content
-        assert result.metadata["title"] == "Sync Path Test"
-    finally:
-        temp_path.unlink()
+    result = extractor.extract_path_sync(yaml_document_path)
+    assert "Sync Path Test" in result.content
+    assert result.metadata["title"] == "Sync Path Test"
 
 
 def test_structured_extract_toml_without_tomllib() -> None:
     import sys
     from unittest.mock import patch
 
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(TOML_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(TOML_MIME_TYPE, DEFAULT_CONFIG)
 
     toml_content = b'title = "No Tomllib Test"'
 
@@ -170,8 +151,7 @@ def test_structured_extract_yaml_without_pyyaml() -> None:
     import sys
     from unittest.mock import patch
 
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(YAML_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(YAML_MIME_TYPE, DEFAULT_CONFIG)
 
     yaml_content = b"title: No PyYAML Test"
 
@@ -185,8 +165,7 @@ def test_structured_extract_yaml_without_pyyaml() -> None:
 
 
 def test_structured_extract_list_data() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     list_content = b'[{"name": "Item 1", "value": 100}, {"name": "Item 2", "value": 200}]'
     result = extractor.extract_bytes_sync(list_content)
@@ -199,8 +178,7 @@ def test_structured_extract_list_data() -> None:
 
 
 def test_structured_extract_simple_string_data() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     simple_content = b'"This is a simple string"'
     result = extractor.extract_bytes_sync(simple_content)
@@ -210,8 +188,7 @@ def test_structured_extract_simple_string_data() -> None:
 
 
 def test_structured_extract_simple_number_data() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     number_content = b"42"
     result = extractor.extract_bytes_sync(number_content)
@@ -221,8 +198,7 @@ def test_structured_extract_simple_number_data() -> None:
 
 
 def test_structured_extract_complex_nested_structure() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     complex_content = b"""{
         "title": "Complex Document",
@@ -258,8 +234,7 @@ def test_structured_extract_complex_nested_structure() -> None:
 
 
 def test_structured_extract_nested_lists() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     nested_content = b"""[
         [
@@ -283,8 +258,7 @@ def test_structured_extract_nested_lists() -> None:
 
 
 def test_structured_extract_with_none_values() -> None:
-    config = ExtractionConfig()
-    extractor = StructuredDataExtractor(JSON_MIME_TYPE, config)
+    extractor = StructuredDataExtractor(JSON_MIME_TYPE, DEFAULT_CONFIG)
 
     content_with_nulls = b"""{
         "title": "Test Document",
@@ -3,6 +3,7 @@ from __future__ import annotations
 import io
 import queue
 import signal
+import warnings
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -25,6 +26,30 @@ from kreuzberg.exceptions import MissingDependencyError, ParsingError
 from PIL import Image
 
 
+@pytest.fixture(scope="session")
+def png_image_bytes() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (100, 100), color="white").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def gmft_config() -> GMFTConfig:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        return GMFTConfig()
+
+
+@pytest.fixture(scope="module")
+def small_df() -> pl.DataFrame:
+    return pl.DataFrame({"col1": [1, 2], "col2": [3, 4]})
+
+
+def test_gmft_config_emits_deprecation_warning() -> None:
+    with pytest.warns(FutureWarning):
+        GMFTConfig()
+
+
 def test_pandas_to_polars_with_none() -> None:
     result = _pandas_to_polars(None)
     assert isinstance(result, pl.DataFrame)
@@ -96,12 +121,11 @@ def test_dataframe_to_markdown_with_empty_polars_dataframe() -> None:
     assert result == ""
 
 
-def test_dataframe_to_markdown_with_polars_dataframe() -> None:
-    df = pl.DataFrame({"col1": [1, 2], "col2": [3, 4]})
-    result = _dataframe_to_markdown(df)
+def test_dataframe_to_markdown_with_polars_dataframe(small_df: pl.DataFrame) -> None:
+    result = _dataframe_to_markdown(small_df)
     assert "col1" in result
     assert "col2" in result
-    assert str(df) in result
+    assert str(small_df) in result
 
 
 def test_dataframe_to_markdown_with_pandas_dataframe() -> None:
@@ -134,9 +158,8 @@ def test_dataframe_to_csv_with_empty_polars_dataframe() -> None:
     assert result == ""
 
 
-def test_dataframe_to_csv_with_polars_dataframe() -> None:
-    df = pl.DataFrame({"col1": [1, 2], "col2": [3, 4]})
-    result = _dataframe_to_csv(df)
+def test_dataframe_to_csv_with_polars_dataframe(small_df: pl.DataFrame) -> None:
+    result = _dataframe_to_csv(small_df)
 
     assert "col1,col2" in result
     assert "1,3" in result
@@ -173,9 +196,8 @@ def test_is_dataframe_empty_with_empty_polars_dataframe() -> None:
     assert result is True
 
 
-def test_is_dataframe_empty_with_nonempty_polars_dataframe() -> None:
-    df = pl.DataFrame({"col1": [1, 2]})
-    result = _is_dataframe_empty(df)
+def test_is_dataframe_empty_with_nonempty_polars_dataframe(small_df: pl.DataFrame) -> None:
+    result = _is_dataframe_empty(small_df)
     assert result is False
 
 
@@ -945,18 +967,13 @@ def test_extract_tables_in_process_exception() -> None:
         assert "traceback" in error_info
 
 
-def test_extract_tables_isolated_success() -> None:
+def test_extract_tables_isolated_success(png_image_bytes: bytes) -> None:
     file_path = "/path/to/file.pdf"
     config = GMFTConfig(verbosity=1)
 
-    test_img = Image.new("RGB", (100, 100), color="white")
-    img_bytes = io.BytesIO()
-    test_img.save(img_bytes, format="PNG")
-    img_bytes.seek(0)
-
     mock_result = [
         {
-            "cropped_image_bytes": img_bytes.getvalue(),
+            "cropped_image_bytes": png_image_bytes,
             "page_number": 1,
             "text": "| test |",
             "df_columns": ["test"],
@@ -993,10 +1010,8 @@ def test_extract_tables_isolated_success() -> None:
         mock_process.terminate.assert_called_once()
 
 
-def test_extract_tables_isolated_process_died_sigsegv() -> None:
+def test_extract_tables_isolated_process_died_sigsegv(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    with pytest.warns(FutureWarning):
-        config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = False
@@ -1017,16 +1032,14 @@ def test_extract_tables_isolated_process_died_sigsegv() -> None:
         patch("time.time", side_effect=[0, 0.1]),
     ):
         with pytest.raises(ParsingError) as exc_info:
-            _extract_tables_isolated(file_path, config)
+            _extract_tables_isolated(file_path, gmft_config)
 
         assert "segmentation fault" in str(exc_info.value)
         assert exc_info.value.context["exit_code"] == -signal.SIGSEGV
 
 
-def test_extract_tables_isolated_process_died_other() -> None:
+def test_extract_tables_isolated_process_died_other(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    with pytest.warns(FutureWarning):
-        config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = False
@@ -1047,15 +1060,14 @@ def test_extract_tables_isolated_process_died_other() -> None:
         patch("time.time", side_effect=[0, 0.1]),
     ):
         with pytest.raises(ParsingError) as exc_info:
-            _extract_tables_isolated(file_path, config)
+            _extract_tables_isolated(file_path, gmft_config)
 
         assert "died unexpectedly with exit code 1" in str(exc_info.value)
         assert exc_info.value.context["exit_code"] == 1
 
 
-def test_extract_tables_isolated_timeout() -> None:
+def test_extract_tables_isolated_timeout(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = True
@@ -1077,16 +1089,15 @@ def test_extract_tables_isolated_timeout() -> None:
         patch("time.sleep"),
     ):
         with pytest.raises(ParsingError) as exc_info:
-            _extract_tables_isolated(file_path, config, timeout=1.0)
+            _extract_tables_isolated(file_path, gmft_config, timeout=1.0)
 
         assert "timed out" in str(exc_info.value)
         assert exc_info.value.context["timeout"] == 1.0
         mock_process.terminate.assert_called_once()
 
 
-def test_extract_tables_isolated_error_from_process() -> None:
+def test_extract_tables_isolated_error_from_process(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_error_info = {
         "error": "Processing failed",
@@ -1109,24 +1120,18 @@ def test_extract_tables_isolated_error_from_process() -> None:
 
     with patch("multiprocessing.get_context", return_value=mock_ctx):
         with pytest.raises(ParsingError) as exc_info:
-            _extract_tables_isolated(file_path, config)
+            _extract_tables_isolated(file_path, gmft_config)
 
         assert "Processing failed" in str(exc_info.value)
         assert exc_info.value.context["error_type"] == "ValueError"
 
 
-def test_extract_tables_isolated_empty_csv() -> None:
+def test_extract_tables_isolated_empty_csv(png_image_bytes: bytes, gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
-
-    test_img = Image.new("RGB", (50, 50), color="blue")
-    img_bytes = io.BytesIO()
-    test_img.save(img_bytes, format="PNG")
-    img_bytes.seek(0)
 
     mock_result = [
         {
-            "cropped_image_bytes": img_bytes.getvalue(),
+            "cropped_image_bytes": png_image_bytes,
             "page_number": 2,
             "text": "",
             "df_columns": [],
@@ -1148,7 +1153,7 @@ def test_extract_tables_isolated_empty_csv() -> None:
     mock_ctx.Process.return_value = mock_process
 
     with patch("multiprocessing.get_context", return_value=mock_ctx):
-        result = _extract_tables_isolated(file_path, config)
+        result = _extract_tables_isolated(file_path, gmft_config)
 
         assert len(result) == 1
         assert result[0]["page_number"] == 2
@@ -1157,9 +1162,8 @@ def test_extract_tables_isolated_empty_csv() -> None:
         assert result[0]["df"].is_empty()
 
 
-def test_extract_tables_isolated_process_needs_kill() -> None:
+def test_extract_tables_isolated_process_needs_kill(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.side_effect = [True, True, True]
@@ -1181,16 +1185,14 @@ def test_extract_tables_isolated_process_needs_kill() -> None:
         patch("time.sleep"),
     ):
         with pytest.raises(ParsingError):
-            _extract_tables_isolated(file_path, config, timeout=1.0)
+            _extract_tables_isolated(file_path, gmft_config, timeout=1.0)
 
         mock_process.terminate.assert_called_once()
         mock_process.kill.assert_called_once()
 
 
-def test_extract_tables_isolated_missing_dependency() -> None:
+def test_extract_tables_isolated_missing_dependency(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    with pytest.warns(FutureWarning):
-        config = GMFTConfig()
 
     error_info = {
         "error": "libcublasLt.so.12: failed to map segment from shared object",
@@ -1213,7 +1215,7 @@ def test_extract_tables_isolated_missing_dependency() -> None:
 
     with patch("multiprocessing.get_context", return_value=mock_ctx):
         with pytest.raises(MissingDependencyError) as exc_info:
-            _extract_tables_isolated(file_path, config, timeout=1.0)
+            _extract_tables_isolated(file_path, gmft_config, timeout=1.0)
 
     assert "kreuzberg['gmft']" in str(exc_info.value)
     assert exc_info.value.context["file_path"] == file_path
@@ -1221,18 +1223,13 @@ def test_extract_tables_isolated_missing_dependency() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_success() -> None:
+async def test_extract_tables_isolated_async_success(png_image_bytes: bytes) -> None:
     file_path = "/path/to/file.pdf"
     config = GMFTConfig(verbosity=2)
 
-    test_img = Image.new("RGB", (100, 100), color="red")
-    img_bytes = io.BytesIO()
-    test_img.save(img_bytes, format="PNG")
-    img_bytes.seek(0)
-
     mock_result = [
         {
-            "cropped_image_bytes": img_bytes.getvalue(),
+            "cropped_image_bytes": png_image_bytes,
             "page_number": 5,
             "text": "| async | test |",
             "df_columns": ["async", "test"],
@@ -1278,9 +1275,8 @@ async def test_extract_tables_isolated_async_success() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_process_died_sigsegv() -> None:
+async def test_extract_tables_isolated_async_process_died_sigsegv(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = False
@@ -1314,16 +1310,15 @@ async def test_extract_tables_isolated_async_process_died_sigsegv() -> None:
         mock_run_sync.side_effect = run_sync_side_effect
 
         with pytest.raises(ParsingError) as exc_info:
-            await _extract_tables_isolated_async(file_path, config)
+            await _extract_tables_isolated_async(file_path, gmft_config)
 
         assert "segmentation fault" in str(exc_info.value)
         assert exc_info.value.context["exit_code"] == -signal.SIGSEGV
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_process_died_other() -> None:
+async def test_extract_tables_isolated_async_process_died_other(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = False
@@ -1357,16 +1352,15 @@ async def test_extract_tables_isolated_async_process_died_other() -> None:
         mock_run_sync.side_effect = run_sync_side_effect
 
         with pytest.raises(ParsingError) as exc_info:
-            await _extract_tables_isolated_async(file_path, config)
+            await _extract_tables_isolated_async(file_path, gmft_config)
 
         assert "died unexpectedly with exit code 42" in str(exc_info.value)
         assert exc_info.value.context["exit_code"] == 42
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_timeout() -> None:
+async def test_extract_tables_isolated_async_timeout(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.return_value = True
@@ -1386,7 +1380,7 @@ async def test_extract_tables_isolated_async_timeout() -> None:
         patch("anyio.fail_after", side_effect=TimeoutError()),
     ):
         with pytest.raises(ParsingError) as exc_info:
-            await _extract_tables_isolated_async(file_path, config, timeout=2.0)
+            await _extract_tables_isolated_async(file_path, gmft_config, timeout=2.0)
 
         assert "timed out" in str(exc_info.value)
         assert exc_info.value.context["timeout"] == 2.0
@@ -1394,9 +1388,8 @@ async def test_extract_tables_isolated_async_timeout() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_error_from_process() -> None:
+async def test_extract_tables_isolated_async_error_from_process(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_error_info = {
         "error": "Async processing failed",
@@ -1431,17 +1424,15 @@ async def test_extract_tables_isolated_async_error_from_process() -> None:
         mock_run_sync.side_effect = run_sync_side_effect
 
         with pytest.raises(ParsingError) as exc_info:
-            await _extract_tables_isolated_async(file_path, config)
+            await _extract_tables_isolated_async(file_path, gmft_config)
 
         assert "Async processing failed" in str(exc_info.value)
         assert exc_info.value.context["error_type"] == "RuntimeError"
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_missing_dependency() -> None:
+async def test_extract_tables_isolated_async_missing_dependency(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    with pytest.warns(FutureWarning):
-        config = GMFTConfig()
 
     error_info = {
         "error": "libcublasLt.so.12: failed to map segment from shared object",
@@ -1477,7 +1468,7 @@ async def test_extract_tables_isolated_async_missing_dependency() -> None:
         mock_run_sync.side_effect = run_sync_side_effect
 
         with pytest.raises(MissingDependencyError) as exc_info:
-            await _extract_tables_isolated_async(file_path, config, timeout=1.0)
+            await _extract_tables_isolated_async(file_path, gmft_config, timeout=1.0)
 
     assert "kreuzberg['gmft']" in str(exc_info.value)
     assert exc_info.value.context["file_path"] == file_path
@@ -1485,18 +1476,12 @@ async def test_extract_tables_isolated_async_missing_dependency() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_empty_csv() -> None:
+async def test_extract_tables_isolated_async_empty_csv(png_image_bytes: bytes, gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
-
-    test_img = Image.new("RGB", (50, 50), color="green")
-    img_bytes = io.BytesIO()
-    test_img.save(img_bytes, format="PNG")
-    img_bytes.seek(0)
 
     mock_result = [
         {
-            "cropped_image_bytes": img_bytes.getvalue(),
+            "cropped_image_bytes": png_image_bytes,
             "page_number": 7,
             "text": "",
             "df_columns": [],
@@ -1530,7 +1515,7 @@ async def test_extract_tables_isolated_async_empty_csv() -> None:
 
         mock_run_sync.side_effect = run_sync_side_effect
 
-        result = await _extract_tables_isolated_async(file_path, config)
+        result = await _extract_tables_isolated_async(file_path, gmft_config)
 
         assert len(result) == 1
         assert result[0]["page_number"] == 7
@@ -1540,9 +1525,8 @@ async def test_extract_tables_isolated_async_empty_csv() -> None:
 
 
 @pytest.mark.anyio
-async def test_extract_tables_isolated_async_process_needs_kill() -> None:
+async def test_extract_tables_isolated_async_process_needs_kill(gmft_config: GMFTConfig) -> None:
     file_path = "/path/to/file.pdf"
-    config = GMFTConfig()
 
     mock_process = Mock()
     mock_process.is_alive.side_effect = [True, True]
@@ -1571,7 +1555,7 @@ async def test_extract_tables_isolated_async_process_needs_kill() -> None:
         mock_run_sync.side_effect = run_sync_side_effect
 
         with pytest.raises(ParsingError):
-            await _extract_tables_isolated_async(file_path, config, timeout=1.0)
+            await _extract_tables_isolated_async(file_path, gmft_config, timeout=1.0)
 
         mock_process.terminate.assert_called_once()
         mock_process.kill.assert_called_once()
@@ -3,14 +3,31 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pytest
-from kreuzberg._token_reduction import StopwordsManager, get_reduction_stats, reduce_tokens
+from kreuzberg._token_reduction import StopwordsManager, _stopwords, get_reduction_stats, reduce_tokens
+from kreuzberg._token_reduction._stopwords import get_default_stopwords_manager
 from kreuzberg._types import TokenReductionConfig
 from kreuzberg.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    from collections.abc import Generator
     from pathlib import Path
 
 
+@pytest.fixture(scope="session")
+def default_manager() -> StopwordsManager:
+    return get_default_stopwords_manager()
+
+
+@pytest.fixture
+def stopwords_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    directory = tmp_path / "stopwords"
+    directory.mkdir()
+    monkeypatch.setattr(_stopwords, "_STOPWORDS_DIR", directory)
+    _stopwords._load_language_stopwords.cache_clear()
+    yield directory
+    _stopwords._load_language_stopwords.cache_clear()
+
+
 def test_reduce_tokens_off_mode_returns_original_text() -> None:
     config = TokenReductionConfig(mode="off")
     text = "This is a test with some stopwords and extra    spaces."
@@ -170,10 +187,8 @@ def test_get_reduction_stats_with_empty_original() -> None:
     assert stats["reduced_characters"] == 0
 
 
-def test_stopwords_manager_loads_english_stopwords() -> None:
-    manager = StopwordsManager()
-
-    stopwords = manager.get_stopwords("en")
+def test_stopwords_manager_loads_english_stopwords(default_manager: StopwordsManager) -> None:
+    stopwords = default_manager.get_stopwords("en")
 
     assert len(stopwords) > 0
     assert "the" in stopwords
@@ -181,17 +196,13 @@ def test_stopwords_manager_loads_english_stopwords() -> None:
     assert "is" in stopwords
 
 
-def test_stopwords_manager_has_language_check() -> None:
-    manager = StopwordsManager()
-
-    assert manager.has_language("en") is True
-    assert manager.has_language("nonexistent") is False
-
+def test_stopwords_manager_has_language_check(default_manager: StopwordsManager) -> None:
+    assert default_manager.has_language("en") is True
+    assert default_manager.has_language("nonexistent") is False
 
-def test_stopwords_manager_supported_languages() -> None:
-    manager = StopwordsManager()
 
-    languages = manager.supported_languages()
+def test_stopwords_manager_supported_languages(default_manager: StopwordsManager) -> None:
+    languages = default_manager.supported_languages()
 
     assert len(languages) > 0
     assert "en" in languages
@@ -209,6 +220,16 @@ def test_stopwords_manager_custom_stopwords() -> None:
     assert "words" in stopwords
 
 
+def test_stopwords_manager_add_custom_stopwords_merges_words() -> None:
+    manager = StopwordsManager(custom_stopwords={"test": ["custom"]})
+
+    manager.add_custom_stopwords("test", ["words", "custom"])
+    manager.add_custom_stopwords("other", {"extra"})
+
+    assert {"custom", "words"} <= manager.get_stopwords("test")
+    assert "extra" in manager.get_stopwords("other")
+
+
 def test_reduce_tokens_empty_text_returns_empty() -> None:
     config = TokenReductionConfig(mode="light")
 
@@ -473,14 +494,13 @@ def test_get_reduction_stats_edge_case_expansion() -> None:
     assert stats["reduced_tokens"] == 2
 
 
-def test_stopwords_manager_concurrent_access() -> None:
+def test_stopwords_manager_concurrent_access(default_manager: StopwordsManager) -> None:
     import concurrent.futures
 
-    manager = StopwordsManager()
     languages = ["en", "es", "fr", "de", "it"]
 
     def load_language(lang: str) -> int:
-        stopwords = manager.get_stopwords(lang)
+        stopwords = default_manager.get_stopwords(lang)
         return len(stopwords)
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
@@ -491,26 +511,19 @@ def test_stopwords_manager_concurrent_access() -> None:
     assert len(results) == 15
 
 
-def test_stopwords_manager_handles_corrupted_file(tmp_path: Path) -> None:
-    from unittest.mock import patch
-
-    corrupted_dir = tmp_path / "stopwords"
-    corrupted_dir.mkdir()
-    corrupted_file = corrupted_dir / "xx_stopwords.json"
+def test_stopwords_manager_handles_corrupted_file(stopwords_dir: Path) -> None:
+    corrupted_file = stopwords_dir / "xx_stopwords.json"
     corrupted_file.write_text("not valid json {[}")
 
-    with patch("kreuzberg._token_reduction._stopwords._STOPWORDS_DIR", corrupted_dir):
-        manager = StopwordsManager()
-
-        stopwords = manager.get_stopwords("xx")
-        assert isinstance(stopwords, set)
-        assert len(stopwords) == 0
+    manager = StopwordsManager()
 
+    stopwords = manager.get_stopwords("xx")
+    assert isinstance(stopwords, set)
+    assert len(stopwords) == 0
 
-def test_stopwords_manager_handles_missing_file() -> None:
-    manager = StopwordsManager()
 
-    stopwords = manager.get_stopwords("zz_nonexistent")
+def test_stopwords_manager_handles_missing_file(default_manager: StopwordsManager) -> None:
+    stopwords = default_manager.get_stopwords("zz_nonexistent")
 
     assert isinstance(stopwords, set)
     assert len(stopwords) == 0
@@ -540,9 +553,7 @@ def test_reduce_tokens_thread_safety() -> None:
     assert all(len(r) > 0 for r in results)
 
 
-def test_stopwords_manager_lru_cache_size() -> None:
-    manager = StopwordsManager()
-
+def test_stopwords_manager_lru_cache_size(default_manager: StopwordsManager) -> None:
     languages = [
         "en",
         "es",
@@ -566,10 +577,10 @@ def test_stopwords_manager_lru_cache_size() -> None:
     ]
 
     for lang in languages:
-        if manager.has_language(lang):
-            manager.get_stopwords(lang)
+        if default_manager.has_language(lang):
+            default_manager.get_stopwords(lang)
 
-    stopwords = manager.get_stopwords("en")
+    stopwords = default_manager.get_stopwords("en")
     assert "the" in stopwords
     assert len(stopwords) > 0
 
@@ -665,19 +676,20 @@ def test_markdown_table_detection_improved() -> None:
     assert "but" not in not_table_result
 
 
-def test_path_traversal_protection() -> None:
-    manager = StopwordsManager()
-
-    dangerous_codes = [
+@pytest.mark.parametrize(
+    "language",
+    [
         "../../../etc/passwd",
         "..\\..\\windows\\system32",
         "en/../../../etc/passwd",
         "en/../../secret",
-    ]
-
-    for dangerous_code in dangerous_codes:
-        stopwords = manager.get_stopwords(dangerous_code)
-        assert stopwords == set()
+        "..en",
+        "./en",
+        "",
+    ],
+)
+def test_path_traversal_protection(default_manager: StopwordsManager, language: str) -> None:
+    assert default_manager.get_stopwords(language) == set()
 
 
 def test_empty_result_handling() -> None:
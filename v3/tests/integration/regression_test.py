@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 
 import pytest
+from anyio import Path as AsyncPath
 from kreuzberg import batch_extract_file, extract_file
 from kreuzberg._types import ExtractionConfig, PSMMode, TesseractConfig
 from kreuzberg.extraction import extract_file_sync
@@ -114,8 +115,8 @@ async def test_psm_mode_4_specifically(google_doc_pdf: Path) -> None:
 async def test_batch_extract_bytes_regression(google_doc_pdf: Path, test_xls: Path) -> None:
     from kreuzberg import batch_extract_bytes
 
-    pdf_content = google_doc_pdf.read_bytes()
-    xls_content = test_xls.read_bytes()
+    pdf_content = await AsyncPath(google_doc_pdf).read_bytes()
+    xls_content = await AsyncPath(test_xls).read_bytes()
 
     files_data = [
         (pdf_content, "application/pdf"),
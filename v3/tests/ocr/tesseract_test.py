@@ -182,18 +182,12 @@ async def test_process_file_error(backend: TesseractBackend, fresh_cache: None)
 
 
 @pytest.mark.anyio
-async def test_process_file_runtime_error(backend: TesseractBackend, fresh_cache: None) -> None:
-    import tempfile
+async def test_process_file_runtime_error(backend: TesseractBackend, fresh_cache: None, tmp_path: Path) -> None:
+    invalid_file = tmp_path / "invalid.png"
+    invalid_file.write_bytes(b"This is not a valid image file")
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        f.write(b"This is not a valid image file")
-        invalid_file = Path(f.name)
-
-    try:
-        with pytest.raises(OCRError):
-            await backend.process_file(invalid_file, language="eng", psm=PSMMode.AUTO)
-    finally:
-        invalid_file.unlink(missing_ok=True)
+    with pytest.raises(OCRError):
+        await backend.process_file(invalid_file, language="eng", psm=PSMMode.AUTO)
 
 
 @pytest.mark.anyio
@@ -1000,18 +994,12 @@ async def test_tesseract_error_handling_process_file_file_not_found(backend: Tes
 
 
 @pytest.mark.anyio
-async def test_tesseract_error_handling_process_image_invalid_format(backend: TesseractBackend) -> None:
-    import tempfile
+async def test_tesseract_error_handling_process_image_invalid_format(backend: TesseractBackend, tmp_path: Path) -> None:
+    invalid_path = tmp_path / "invalid.png"
+    invalid_path.write_bytes(b"This is not a valid PNG file")
 
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        f.write(b"This is not a valid PNG file")
-        invalid_path = Path(f.name)
-
-    try:
-        with pytest.raises(OCRError):
-            await backend.process_file(invalid_path, language="eng")
-    finally:
-        invalid_path.unlink()
+    with pytest.raises(OCRError):
+        await backend.process_file(invalid_path, language="eng")
 
 
 def test_tesseract_error_handling_sync_process_image_temp_file_error(backend: TesseractBackend) -> None:
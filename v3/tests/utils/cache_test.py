@@ -1,10 +1,8 @@
 from __future__ import annotations
 
 import os
-import tempfile
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING
 from unittest.mock import patch
 
 import pytest
@@ -22,14 +20,10 @@ from kreuzberg._utils._cache import (
     get_table_cache,
 )
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
-
 
 @pytest.fixture
-def temp_cache_dir() -> Generator[Path, None, None]:
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+def temp_cache_dir(tmp_path: Path) -> Path:
+    return tmp_path
 
 
 @pytest.fixture
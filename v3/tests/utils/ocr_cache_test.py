@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import tempfile
 import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -20,9 +18,6 @@ from kreuzberg._utils._ocr_cache import (
 )
 from PIL import Image
 
-if TYPE_CHECKING:
-    from collections.abc import Generator
-
 
 @pytest.fixture
 def sample_image() -> Image.Image:
@@ -40,14 +35,10 @@ def sample_extraction_result() -> ExtractionResult:
 
 
 @pytest.fixture
-def temp_file() -> Generator[Path, None, None]:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as tmp:
-        tmp.write(b"test content")
-        tmp_path = Path(tmp.name)
-
-    yield tmp_path
-
-    tmp_path.unlink(missing_ok=True)
+def temp_file(tmp_path: Path) -> Path:
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(b"test content")
+    return file_path
 
 
 class TestGetFileInfo:
@@ -133,10 +133,10 @@ def test_pypdfium_file_lock_different_files(tmp_path: Path) -> None:
     execution_times = {}
 
     def thread_func(file_path: Path, thread_id: str) -> None:
-        start_time = time.time()
+        start_time = time.perf_counter()
         with pypdfium_file_lock(file_path):
             time.sleep(0.05)
-        end_time = time.time()
+        end_time = time.perf_counter()
         execution_times[thread_id] = (start_time, end_time)
 
     thread1 = threading.Thread(target=thread_func, args=(file1, "thread1"))